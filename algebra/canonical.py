@@ -1,19 +1,99 @@
 """
 Canonical
 """
+import operator
+
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
-from math import prod
+from dataclasses import dataclass, field
 from inspect import signature
 # LOCAL #
 from logical.algebra.functions import table
 from logical.algebra.structure import *
+from logical.truth_tables import packed_eval
+
+
+_PENDING = object()  # CanonicalForm._table before the formula was evaluated
+
+
+class _BitColumn:
+    """
+    Packed Truth Table Column With Only The Structure Operators (+, * and -) Of A Boolean Element
+    """
+    __slots__ = ('bits', 'mask')
+
+    def __init__(self, bits: int, mask: int) -> None:
+        self.bits = bits
+        self.mask = mask
+
+    def __add__(self, other: '_BitColumn') -> '_BitColumn':
+        if not isinstance(other, _BitColumn): return NotImplemented
+        return _BitColumn(self.bits | other.bits, self.mask)
+
+    def __mul__(self, other: '_BitColumn') -> '_BitColumn':
+        if not isinstance(other, _BitColumn): return NotImplemented
+        return _BitColumn(self.bits & other.bits, self.mask)
+
+    def __neg__(self) -> '_BitColumn':
+        return _BitColumn(self.bits ^ self.mask, self.mask)
+
+    def __eq__(self, other) -> bool:
+        raise TypeError('comparison of packed columns is undefined')
+
+    def __bool__(self) -> bool:
+        raise TypeError('truth value of a packed column is undefined')
+
+    __ne__ = __eq__
+    __hash__ = None
+
+
+def _absorbs(el: Element, op: Callable, elements: Iterable[Element]) -> bool:
+    """ :returns: whether op(el, x) == el for every element x (a missing identity absorbs nothing) """
+    try:
+        return all(op(el, x) == el for x in elements)
+    except (AttributeError, TypeError):
+        return False
 
 
 @dataclass(frozen=True, slots=True)
 class CanonicalForm:
     struct: Structure
     formula: Callable
+    _params: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _n: int = field(init=False, repr=False, compare=False)
+    _neg: dict[Element, Element] = field(init=False, repr=False, compare=False)
+    _table: int | None = field(init=False, repr=False, compare=False)  # packed truth table of a Boolean formula
+    _zero_absorbs: bool = field(init=False, repr=False, compare=False)  # zero * x == zero
+    _one_absorbs: bool = field(init=False, repr=False, compare=False)  # one + x == one
+
+    def __post_init__(self) -> None:
+        code = getattr(self.formula, '__code__', None)  # builtins and partials only have a signature
+        params = code.co_varnames[:code.co_argcount] if code is not None else tuple(signature(self.formula).parameters)
+        object.__setattr__(self, '_params', params)
+        object.__setattr__(self, '_n', len(params))
+        object.__setattr__(self, '_neg', {el: -el for el in self.struct.elements})
+        object.__setattr__(self, '_table', _PENDING)  # the formula is first evaluated on iteration
+        struct = self.struct
+        object.__setattr__(self, '_zero_absorbs', _absorbs(struct.identity_add, operator.mul, struct.elements))
+        object.__setattr__(self, '_one_absorbs', _absorbs(struct.identity_mul, operator.add, struct.elements))
+
+    def _rows(self, n: int, minterms: bool) -> Iterable[tuple[Element, ...]]:
+        """ :returns: The Rows On Which The Formula Is True (minterms) Or False (maxterms) """
+        res = self._table
+        if res is _PENDING:
+            res = packed_eval(self.formula, n, _BitColumn) if self.struct.is_bool else None
+            object.__setattr__(self, '_table', res)
+        if res is None:
+            for operands in self.struct.operands(n):
+                if bool(self.formula(*operands)) is minterms:
+                    yield operands
+            return
+        elems = self.struct.sorted_elements
+        if not minterms: res ^= (1 << (1 << n)) - 1
+        while res:
+            b = res & -res
+            i = b.bit_length() - 1
+            yield tuple(elems[i >> (n - k - 1) & 1] for k in range(n))
+            res ^= b
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,25 +102,32 @@ class DNF(CanonicalForm):
 
     def __iter__(self) -> Iterable[Element]:
         """ :returns: The Minimum Terms """
-        n = len(signature(self.formula).parameters)
-        for operands in self.struct.operands(n):
-            if self.formula(*operands):
-                yield operands
+        yield from self._rows(self._n, minterms=True)
 
     def __str__(self) -> str:
-        params = signature(self.formula).parameters
+        params = self._params
         return '+'.join(
             ''.join('%s%s' % (x, '' if op else '\u0304') for x, op in zip(params, operands)) for operands in self)
 
     def ascii(self) -> str:
-        params = signature(self.formula).parameters
+        params = self._params
         return ' + '.join(
             '*'.join('%s%s' % ('' if op else '-', x) for x, op in zip(params, operands))
             for operands in self)
 
     def __call__(self) -> Element:
-        return sum((prod((op for op in operands), start=self.struct.identity_mul)
-                    for operands in self), start=self.struct.identity_add)
+        zero, one = self.struct.identity_add, self.struct.identity_mul
+        zero_absorbs, one_absorbs = self._zero_absorbs, self._one_absorbs
+        res = zero
+        for operands in self:
+            term = one
+            for op in operands:
+                term *= op
+                if zero_absorbs and term == zero: break  # the term stays zero, which adds nothing to the sum
+            else:
+                res += term
+                if one_absorbs and res == one: break  # the sum stays one
+        return res
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,23 +136,32 @@ class CNF(CanonicalForm):
 
     def __iter__(self) -> Iterable[Element]:
         """ :returns: The Maximum Terms """
-        n = len(signature(self.formula).parameters)
-        for operands in self.struct.operands(n):
-            if not self.formula(*operands):
-                yield tuple(-op for op in operands)
+        neg = self._neg
+        for operands in self._rows(self._n, minterms=False):
+            yield tuple(neg[op] for op in operands)
 
     def __str__(self) -> str:
-        params = signature(self.formula).parameters
+        params = self._params
         return ''.join(
             '(%s)' % '+'.join('%s%s' % (x, '' if op else '\u0304') for x, op in zip(params, operands))
             for operands in self)
 
     def __call__(self) -> Element:
-        return prod((sum((op for op in operands), start=self.struct.identity_add)
-                     for operands in self), start=self.struct.identity_mul)
+        zero, one = self.struct.identity_add, self.struct.identity_mul
+        zero_absorbs, one_absorbs = self._zero_absorbs, self._one_absorbs
+        res = one
+        for operands in self:
+            term = zero
+            for op in operands:
+                term += op
+                if one_absorbs and term == one: break  # the term stays one, which multiplies nothing in
+            else:
+                res *= term
+                if zero_absorbs and res == zero: break  # the product stays zero
+        return res
 
     def ascii(self) -> str:
-        params = signature(self.formula).parameters
+        params = self._params
         return ' * '.join(
             '(%s)' % '+'.join('%s%s' % ('' if op else '-', x) for x, op in zip(params, operands))
             for operands in self)
@@ -136,6 +232,17 @@ def doctest_canonical_forms() -> None:
     >>> print(cnf)
     (x+y+z̄)(x+ȳ+z̄)
 
+    >>> f = lambda x, y: x if x == y else -y
+    >>> list(DNF(B, f))
+    [(B(1), B(0)), (B(1), B(1))]
+    >>> list(CNF(B, f))
+    [(B(1), B(1)), (B(1), B(0))]
+
+    >>> import operator
+    >>> mul = DNF(B, operator.mul)
+    >>> list(mul), str(mul)
+    ([(B(1), B(1))], 'ab')
+
     >>> f = B.bind(lambda x, y: (x + -y) * (-x + -y))
     >>> f(1, 1).value
     0
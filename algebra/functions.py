@@ -3,6 +3,7 @@ Boolean Algebra
 """
 from collections.abc import Callable
 from inspect import signature
+from itertools import product
 # LOCAL #
 from math_utils.functions import prime_power
 from logical.algebra.structure import *
@@ -20,12 +21,16 @@ __all__ = [
 
 
 def is_commutative(struct: Field | Structure) -> bool:
-    return all(x + y == y + x and x * y == y * x for x, y in struct.operands(2))
+    return all(x + y == y + x and x * y == y * x for x, y in struct.pairs_upper())
 
 
-def is_distributive(struct: Field | Structure) -> bool:
+def is_distributive(struct: Field | Structure, commutative: bool | None = None) -> bool:
+    """ :param commutative: is_commutative(struct) when already known, otherwise it is checked here """
+    if commutative is None: commutative = is_commutative(struct)
+    # both laws are symmetric in y and z once the operations commute
+    yz = struct.pairs_upper() if commutative else struct.operands(2)
     return all(x * (y + z) == (x * y) + (x * z) and x + (y * z) == (x + y) * (x + z)
-               for x, y, z in struct.operands(3))
+               for (y, z), x in product(yz, struct.sorted_elements))
 
 
 def has_identities(struct: Field | Structure) -> bool:
@@ -33,12 +38,13 @@ def has_identities(struct: Field | Structure) -> bool:
 
 
 def is_complementary(struct: Field | Structure) -> bool:
-    return all(x + -x == struct[1] and x * -x == struct[0] for x in struct.elements)
+    zero, one = struct[0], struct[1]
+    return all(x + -x == one and x * -x == zero for x in struct.elements)
 
 
 def is_boolean_algebraic(struct: Field | Structure) -> bool:
     return (is_commutative(struct)
-            and is_distributive(struct)
+            and is_distributive(struct, commutative=True)
             and has_identities(struct)
             and is_complementary(struct))
 
@@ -79,9 +85,9 @@ def table(struct: Field | Structure, formula: Callable[..., ...]) -> None:
     Print table for N-ARY OPERATIONS on given Structure
     """
     n = formula.__code__.co_argcount
-    width = len(str(max(struct.elements)))
+    fmt = '  '.join(['{:>%d}' % len(str(max(struct.elements)))] * n) + ' | {}'
     for operands in struct.operands(n):
-        print('%s | %s' % ('  '.join(str(operand).rjust(width) for operand in operands), formula(*operands)))
+        print(fmt.format(*map(str, operands), formula(*operands)))
 
 
 def doctest_functions() -> None:
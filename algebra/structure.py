@@ -5,8 +5,8 @@ import operator
 
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from functools import cached_property, total_ordering
-from itertools import product
+from functools import cache, cached_property
+from itertools import combinations_with_replacement, product
 from math import gcd, isqrt, lcm
 from typing import TypeVar
 # LOCAL
@@ -34,6 +34,146 @@ def find_multiplicative_identity(elements: Iterable[_T]) -> _T | None:
     return next((x for x in elements if all(x * y == y for y in elements)), None)
 
 
+class _Element:
+    """
+    Element Of A Structure
+    """
+    __slots__ = ('value', 'owner')
+
+    def __init__(self, value: int, owner: 'Structure') -> None:
+        self.value = value
+        self.owner = owner
+
+    def __repr__(self) -> str:
+        return f'{self.owner.name}({self.value})'
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __index__(self) -> int:
+        return self.value
+
+    def __hash__(self) -> int:
+        return self.value
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other) -> bool:
+        return self.value < other.value
+
+    def __le__(self, other) -> bool:
+        return self.value <= other.value
+
+    def __gt__(self, other) -> bool:
+        return self.value > other.value
+
+    def __ge__(self, other) -> bool:
+        return self.value >= other.value
+
+    def __add__(self, other) -> '_Element':
+        return self.__class__(self.owner.add(self.value, other.value), self.owner)
+
+    def __mul__(self, other) -> '_Element':
+        return self.__class__(self.owner.mul(self.value, other.value), self.owner)
+
+    def __neg__(self) -> '_Element':
+        return _Element(self.owner.inv(self.value), self.owner)
+
+
+class _FieldElement(_Element):
+    """
+    Element Of A Field (values are reduced modulo the order)
+    """
+    __slots__ = ()
+
+    def __init__(self, value: int, owner: 'Field') -> None:
+        super().__init__(value % owner.ord, owner)
+
+    def __add__(self, other) -> '_FieldElement':
+        owner = self.owner
+        if owner._is_zn: return owner._elements[(self.value + other.value) % owner.ord]
+        return _FieldElement(owner.add(self.value, other.value), owner)
+
+    def __mul__(self, other) -> '_FieldElement':
+        owner = self.owner
+        if owner._is_zn: return owner._elements[self.value * other.value % owner.ord]
+        return _FieldElement(owner.mul(self.value, other.value), owner)
+
+    def __pow__(self, other) -> '_FieldElement':
+        return self.owner.pow(self, other)
+
+    def __neg__(self) -> '_FieldElement':
+        return self.owner.add_inv(self)
+
+
+def _unsupported(self, *_) -> None:
+    raise TypeError(f'unsupported operation for {self!r}')
+
+
+class _BoolElement(int):
+    """
+    Element Of A Boolean Structure (OR, AND, NOT on {0, 1}) which is the int 0 or 1 itself
+
+    Only the operations of an Element are supported, the int arithmetic it would inherit raises TypeError.
+    """
+
+    def __new__(cls, value: int, owner: 'Structure') -> '_BoolElement':
+        self = super().__new__(cls, value)
+        self.owner = owner
+        return self
+
+    def __getnewargs__(self) -> tuple[int, 'Structure']:
+        return int(self), self.owner
+
+    @property
+    def value(self) -> int:
+        return int(self)
+
+    def __repr__(self) -> str:
+        return f'{self.owner.name}({int(self)})'
+
+    __str__ = int.__repr__
+
+    def __eq__(self, other) -> bool:
+        return int(self) == other.value
+
+    def __ne__(self, other) -> bool:
+        return int(self) != other.value
+
+    def __lt__(self, other) -> bool:
+        return int(self) < other.value
+
+    def __le__(self, other) -> bool:
+        return int(self) <= other.value
+
+    def __gt__(self, other) -> bool:
+        return int(self) > other.value
+
+    def __ge__(self, other) -> bool:
+        return int(self) >= other.value
+
+    def __add__(self, other) -> '_BoolElement':
+        if other.__class__ is _BoolElement: return self.owner._bits[self or other]
+        return _BoolElement(self.owner.add(int(self), other.value), self.owner)
+
+    def __mul__(self, other) -> '_BoolElement':
+        if other.__class__ is _BoolElement: return self.owner._bits[self and other]
+        return _BoolElement(self.owner.mul(int(self), other.value), self.owner)
+
+    def __neg__(self) -> '_BoolElement':
+        return self.owner._bits[not self]
+
+    __hash__ = int.__hash__
+    __radd__ = __rmul__ = __sub__ = __rsub__ = __truediv__ = __rtruediv__ = __floordiv__ = __rfloordiv__ = \
+        __mod__ = __rmod__ = __divmod__ = __rdivmod__ = __pow__ = __rpow__ = __lshift__ = __rlshift__ = \
+        __rshift__ = __rrshift__ = __and__ = __rand__ = __or__ = __ror__ = __xor__ = __rxor__ = \
+        __invert__ = __pos__ = __abs__ = __round__ = __trunc__ = __floor__ = __ceil__ = _unsupported
+
+
 @dataclass
 class Structure(Iterable):
     """
@@ -55,17 +195,19 @@ class Structure(Iterable):
                f'inv={self.inv.__name__})'
 
     def __post_init__(self) -> None:
+        self._is_bool = self.set == {0, 1} and (self.add, self.mul, self.inv) == (OR, AND, NOT)
         self._elements = {el: self._generate_element(el) for el in self.set}
+        if self._is_bool: self._bits = (self._elements[0], self._elements[1])
         id_add = find_additive_identity(self.elements)
-        if id_add is not None: self.identity_add: Element = id_add
+        self.identity_add: Element = id_add if id_add is not None else float('nan')
         id_mul = find_multiplicative_identity(self.elements)
-        if id_mul is not None: self.identity_mul: Element = id_mul
+        self.identity_mul: Element = id_mul if id_mul is not None else float('nan')
 
     def __getitem__(self, identity: int) -> Element:
         if identity == 0:
-            return getattr(self, 'identity_add', float('nan'))
+            return self.identity_add
         if identity == 1:
-            return getattr(self, 'identity_mul', float('nan'))
+            return self.identity_mul
         raise ValueError(f'invalid identity: {identity} not in {{0, 1}} ')
 
     @cached_property
@@ -82,51 +224,29 @@ class Structure(Iterable):
         if value in self._elements: return self._elements[value]
         raise ValueError(f'value: {value} not in {self.set}')
 
-    # noinspection PyShadowingNames
-    def _generate_element(self, value: int) -> Element:
-        instance = self
-
-        @total_ordering
-        class Element:
-            def __init__(self, __value: int) -> None:
-                self.value = __value
-
-            def __repr__(self) -> str:
-                return f'{instance.name}({self.value})'
-
-            def __str__(self) -> str:
-                return str(self.value)
-
-            def __index__(self) -> int:
-                return self.value
-
-            def __hash__(self) -> int:
-                return self.value
-
-            def __bool__(self) -> bool:
-                return bool(self.value)
-
-            def __eq__(self, other) -> bool:
-                return self.value == other.value
-
-            def __lt__(self, other) -> bool:
-                return self.value < other.value
-
-            def __add__(self, other) -> 'Element':
-                return Element(instance.add(self.value, other.value))
-
-            def __mul__(self, other) -> 'Element':
-                return Element(instance.mul(self.value, other.value))
-
-            def __neg__(self) -> 'Element':
-                return Element(instance.inv(self.value))
+    @property
+    def is_bool(self) -> bool:
+        """ :returns: whether the structure is {0, 1} under the OR, AND and NOT gates """
+        return self._is_bool
 
+    def _generate_element(self, value: int) -> Element:
+        if self._is_bool:
+            return _BoolElement(value, self)
         if value in self.set:
-            return Element(value)
+            return _Element(value, self)
         raise ValueError(f'invalid value: {value} not in {self.set}')
 
+    @cached_property
+    def sorted_elements(self) -> tuple[Element, ...]:
+        """ :returns: The Elements In Ascending Order """
+        return tuple(sorted(self.elements))
+
     def operands(self, n: int) -> Iterable[Element]:
-        return product(sorted(self.elements), repeat=n)
+        return product(self.sorted_elements, repeat=n)
+
+    def pairs_upper(self) -> Iterable[tuple[Element, Element]]:
+        """ :returns: Pairs (x, y) with x <= y """
+        return combinations_with_replacement(self.sorted_elements, 2)
 
     def bind(self, formula: Callable) -> Callable[..., ...]:
         """ Binds Formula to Structure """
@@ -136,17 +256,24 @@ class Structure(Iterable):
 B = Structure('B', {0, 1}, OR, AND, NOT)  # Boolean Structure
 
 
+# noinspection PyPep8Naming
+@cache
+def _make_D(n: int) -> Structure:
+    def floordiv(divisor: int) -> int:
+        return n // divisor
+
+    step = 2 if n % 2 else 1  # odd numbers have no even divisors
+    divisors = {i for k in range(1, isqrt(n) + 1, step) if not n % k for i in (k, n // k)}
+    return Structure(f'D{n}', divisors, lcm, gcd, floordiv)
+
+
 class D:
     """
-    DIV Factory Class
+    DIV Factory Class (D(n) is built once per n)
     """
 
     def __new__(cls, n: int) -> Structure:
-        def floordiv(divisor: int) -> int:
-            return n // divisor
-
-        divisors = {i for k in range(1, isqrt(n) + 1) if not n % k for i in {k, n // k}}
-        return Structure(f'D{n}', divisors, lcm, gcd, floordiv)
+        return _make_D(n)
 
 
 @dataclass
@@ -167,31 +294,36 @@ class Field(Iterable):
                f'mul={self.mul.__name__})'
 
     def __post_init__(self) -> None:
+        self._is_zn = self.add is operator.add and self.mul is operator.mul  # integers modulo ord
         self._elements = {el: self._generate_element(el) for el in range(self.ord)}
+        self._is_prime_order = self.ord > 1 and all(self.ord % k for k in range(2, isqrt(self.ord) + 1))
         id_add = find_additive_identity(self.elements)
-        if id_add is not None: self.identity_add: Element = id_add
+        self.identity_add: Element = id_add if id_add is not None else float('nan')
         id_mul = find_multiplicative_identity(self.elements)
-        if id_mul is not None: self.identity_mul: Element = id_mul
+        self.identity_mul: Element = id_mul if id_mul is not None else float('nan')
 
     def __getitem__(self, identity: int) -> Element:
         if identity == 0:
-            return getattr(self, 'identity_add', float('nan'))
+            return self.identity_add
         if identity == 1:
-            return getattr(self, 'identity_mul', float('nan'))
+            return self.identity_mul
         raise ValueError(f'invalid identity: {identity} not in {{0, 1}} ')
 
-    @property
+    @cached_property
     def elements(self) -> set[Element]:
         return set(self._elements.values())
 
     def add_inv(self, other: Element) -> Element:  # additive inverse -> -a
         if other == self[0]: return other
+        if self._is_zn: return self(self.ord - other.value)
         return next((el for el in self.elements if other + el == self[0]), self[0])
 
     def pow(self, base: Element, exp: int) -> Element:
         if exp < 0: return self.mul_inv(self.pow(base, -exp))
         if self.ord in {0, 1}: return self[0]
         if exp == 0: return self[1]
+        if self._is_zn:  # built-in modular exponentiation
+            return self(pow(base.value, exp, self.ord))
         if base in {self[0], self[1]}: return base
         res = self[1]
         while exp:
@@ -203,6 +335,7 @@ class Field(Iterable):
     def mul_inv(self, other: Element) -> Element:  # multiplicative inverse -> a ** -1
         if other == self[0]: return float('nan')
         if other == self[1]: return other
+        if self._is_zn and self._is_prime_order: return self(pow(other.value, self.ord - 2, self.ord))  # Fermat
         return next((el for el in self.elements if other * el == self[1]), self[1])
 
     def __str__(self) -> str:
@@ -214,52 +347,25 @@ class Field(Iterable):
     def __call__(self, value: int) -> Element:
         return self._elements[value % self.ord]
 
-    # noinspection PyShadowingNames
-    def _generate_element(self, value: int) -> Element:
-        instance = self
-
-        @total_ordering
-        class Element:
-            def __init__(self, __value: int) -> None:
-                self.value = __value % instance.ord
-
-            def __repr__(self) -> str:
-                return f'{instance.name}({self.value})'
-
-            def __str__(self) -> str:
-                return str(self.value)
-
-            def __index__(self) -> int:
-                return self.value
-
-            def __hash__(self) -> int:
-                return self.value
-
-            def __bool__(self) -> bool:
-                return bool(self.value)
-
-            def __eq__(self, other) -> bool:
-                return self.value == other.value
-
-            def __lt__(self, other) -> bool:
-                return self.value < other.value
-
-            def __add__(self, other) -> 'Element':
-                return Element(instance.add(self.value, other.value))
-
-            def __mul__(self, other) -> 'Element':
-                return Element(instance.mul(self.value, other.value))
-
-            def __pow__(self, other) -> 'Element':
-                return instance.pow(self, other)
+    @property
+    def is_bool(self) -> bool:
+        """ :returns: whether the field is {0, 1} under the OR, AND and NOT gates (never, a Field has no inv) """
+        return False
 
-            def __neg__(self) -> 'Element':
-                return instance.add_inv(self)
+    def _generate_element(self, value: int) -> Element:
+        return _FieldElement(value, self)
 
-        return Element(value)
+    @cached_property
+    def sorted_elements(self) -> tuple[Element, ...]:
+        """ :returns: The Elements In Ascending Order """
+        return tuple(sorted(self.elements))
 
     def operands(self, n: int) -> Iterable[Element]:
-        return product(sorted(self.elements), repeat=n)
+        return product(self.sorted_elements, repeat=n)
+
+    def pairs_upper(self) -> Iterable[tuple[Element, Element]]:
+        """ :returns: Pairs (x, y) with x <= y """
+        return combinations_with_replacement(self.sorted_elements, 2)
 
     def bind(self, function: Callable) -> Callable[..., ...]:
         """ Binds Function to Field """
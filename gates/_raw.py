@@ -0,0 +1,50 @@
+"""
+Uncast Gates (0/1 int in/out) For Bulk Evaluation
+
+Only an export surface: the library itself does not call these yet.
+"""
+# LOCAL #
+from logical.gates.binary import GATES_RAW
+from logical.gates.functional_complete.nor import _NOR_raw
+from logical.gates.unary import _ID_raw, _NOT_raw
+
+__all__ = [
+    'A',
+    'AND',
+    'A_IMPLY_B',
+    'A_NIMPLY_B',
+    'B',
+    'B_IMPLY_A',
+    'B_NIMPLY_A',
+    'CONTRADICTION',
+    'ID',
+    'NAND',
+    'NOR',
+    'NOT',
+    'NOT_A',
+    'NOT_B',
+    'OR',
+    'TAUTOLOGY',
+    'XNOR',
+    'XOR'
+]
+
+ID = _ID_raw
+NOT = _NOT_raw
+
+CONTRADICTION = GATES_RAW[0b0000]
+AND = GATES_RAW[0b0001]
+A_NIMPLY_B = GATES_RAW[0b0010]
+A = GATES_RAW[0b0011]
+B_NIMPLY_A = GATES_RAW[0b0100]
+B = GATES_RAW[0b0101]
+XOR = GATES_RAW[0b0110]
+OR = GATES_RAW[0b0111]
+NOR = _NOR_raw
+XNOR = GATES_RAW[0b1001]
+NOT_B = GATES_RAW[0b1010]
+B_IMPLY_A = GATES_RAW[0b1011]
+NOT_A = GATES_RAW[0b1100]
+A_IMPLY_B = GATES_RAW[0b1101]
+NAND = GATES_RAW[0b1110]
+TAUTOLOGY = GATES_RAW[0b1111]
@@ -13,6 +13,7 @@ __all__ = [
     'B_NIMPLY_A',
     'CONTRADICTION',
     'GATES',
+    'GATES_RAW',
     'NAND',
     'NOR',
     'NOT_A',
@@ -20,7 +21,8 @@ __all__ = [
     'OR',
     'TAUTOLOGY',
     'XNOR',
-    'XOR'
+    'XOR',
+    'eval_gate'
 ]
 
 
@@ -187,6 +189,170 @@ GATES = {  # key = output produced by gate (w/ binary ordered vars)
     0b1111: TAUTOLOGY
 }
 
+
+# uncast variants (0/1 int in/out, bitwise) for bulk evaluation
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _CONTRADICTION_raw(a: int, b: int) -> int:
+    """
+    CONTRADICTION Gate (uncast)
+    """
+    return 0
+
+
+# noinspection PyPep8Naming
+def _AND_raw(a: int, b: int) -> int:
+    """
+    AND Gate (uncast)
+    """
+    return a & b
+
+
+# noinspection PyPep8Naming
+def _A_NIMPLY_B_raw(a: int, b: int) -> int:
+    """
+    A NIMPLY B Gate (uncast)
+    """
+    return a & (b ^ 1)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _A_raw(a: int, b: int) -> int:
+    """
+    A Gate (uncast)
+    """
+    return a
+
+
+# noinspection PyPep8Naming
+def _B_NIMPLY_A_raw(a: int, b: int) -> int:
+    """
+    B NIMPLY A Gate (uncast)
+    """
+    return (a ^ 1) & b
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _B_raw(a: int, b: int) -> int:
+    """
+    B Gate (uncast)
+    """
+    return b
+
+
+# noinspection PyPep8Naming
+def _XOR_raw(a: int, b: int) -> int:
+    """
+    XOR Gate (uncast)
+    """
+    return a ^ b
+
+
+# noinspection PyPep8Naming
+def _OR_raw(a: int, b: int) -> int:
+    """
+    OR Gate (uncast)
+    """
+    return a | b
+
+
+# noinspection PyPep8Naming
+def _NOR_raw(a: int, b: int) -> int:
+    """
+    NOR Gate (uncast)
+    """
+    return (a | b) ^ 1
+
+
+# noinspection PyPep8Naming
+def _XNOR_raw(a: int, b: int) -> int:
+    """
+    XNOR Gate (uncast)
+    """
+    return a ^ b ^ 1
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _NOT_B_raw(a: int, b: int) -> int:
+    """
+    NOT B Gate (uncast)
+    """
+    return b ^ 1
+
+
+# noinspection PyPep8Naming
+def _B_IMPLY_A_raw(a: int, b: int) -> int:
+    """
+    B IMPLY A Gate (uncast)
+    """
+    return a | (b ^ 1)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _NOT_A_raw(a: int, b: int) -> int:
+    """
+    NOT A Gate (uncast)
+    """
+    return a ^ 1
+
+
+# noinspection PyPep8Naming
+def _A_IMPLY_B_raw(a: int, b: int) -> int:
+    """
+    A IMPLY B Gate (uncast)
+    """
+    return (a ^ 1) | b
+
+
+# noinspection PyPep8Naming
+def _NAND_raw(a: int, b: int) -> int:
+    """
+    NAND Gate (uncast)
+    """
+    return (a & b) ^ 1
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _TAUTOLOGY_raw(a: int, b: int) -> int:
+    """
+    TAUTOLOGY Gate (uncast)
+    """
+    return 1
+
+
+GATES_RAW = {  # same gates on 0/1 ints, bitwise and without the cast wrapper
+    0b0000: _CONTRADICTION_raw,
+    0b0001: _AND_raw,
+    0b0010: _A_NIMPLY_B_raw,
+    0b0011: _A_raw,
+    0b0100: _B_NIMPLY_A_raw,
+    0b0101: _B_raw,
+    0b0110: _XOR_raw,
+    0b0111: _OR_raw,
+    0b1000: _NOR_raw,
+    0b1001: _XNOR_raw,
+    0b1010: _NOT_B_raw,
+    0b1011: _B_IMPLY_A_raw,
+    0b1100: _NOT_A_raw,
+    0b1101: _A_IMPLY_B_raw,
+    0b1110: _NAND_raw,
+    0b1111: _TAUTOLOGY_raw
+}
+
+# output of gate <gate_id> for inputs (a, b) at index gate_id * 4 + (a << 1 | b)
+_TABLE = bytes(gate_id >> (3 - row) & 1 for gate_id in range(16) for row in range(4))
+
+
+def eval_gate(gate_id: int, a: int, b: int) -> int:
+    """
+    Evaluates GATES[gate_id] by table lookup (the gate id is its own truth table)
+
+    >>> eval_gate(0b0001, 1, 1), eval_gate(0b0110, 1, 1), eval_gate(0b1000, 0, 0)
+    (1, 0, 1)
+    """
+    return _TABLE[gate_id << 2 | a << 1 | b]
+
+
 if __name__ == '__main__':
     FALSE = CONTRADICTION
     TRUE = TAUTOLOGY
@@ -195,3 +361,7 @@ if __name__ == '__main__':
     GT = A_NIMPLY_B  # equiv. to >  for booleans
     LE = A_IMPLY_B  # equiv. to <= for booleans
     LT = B_NIMPLY_A  # equiv. to <  for booleans
+
+    import doctest
+
+    doctest.testmod()
@@ -10,6 +10,8 @@ Excerpt from wikipedia.com:
 """
 from utils.decorating import cast, multicast
 
+NAND_ONLY = False  # evaluate the gates as the NAND networks drawn in their docstrings
+
 
 # noinspection PyPep8Naming
 @cast
@@ -63,6 +65,7 @@ def TNAND(A, B, C):
     >>> TNAND(1, 1, 1)
     0
     """
+    if not NAND_ONLY: return not (A and B and C)
     X = NAND(A, B)
     return NAND(NAND(X, X), C)
 
@@ -104,6 +107,7 @@ def NAND_NOT(A):
     >>> NAND_NOT(1)
     0
     """
+    if not NAND_ONLY: return not A
     return NAND(A, A)
 
 
@@ -162,6 +166,7 @@ def NAND_AND(A, B):
     >>> NAND_AND(1, 1)
     1
     """
+    if not NAND_ONLY: return bool(A and B)
     X = NAND(A, B)
     return NAND(X, X)
 
@@ -223,6 +228,7 @@ def NAND_XOR(A, B):
     >>> NAND_XOR(1, 1)
     0
     """
+    if not NAND_ONLY: return bool(A) != bool(B)
     X = NAND(A, B)
     return NAND(NAND(A, X), NAND(X, B))
 
@@ -250,6 +256,7 @@ def NAND_OR(A, B):
     >>> NAND_OR(1, 1)
     1
     """
+    if not NAND_ONLY: return bool(A or B)
     return NAND(NAND(A, A), NAND(B, B))
 
 
@@ -277,6 +284,7 @@ def NAND_NOR(A, B):
     >>> NAND_NOR(1, 1)
     0
     """
+    if not NAND_ONLY: return not (A or B)
     X = NAND(NAND(A, A), NAND(B, B))
     return NAND(X, X)
 
@@ -306,6 +314,7 @@ def NAND_XNOR(A, B):  # FIXME: _
     >>> NAND_XNOR(1, 1)
     1
     """
+    if not NAND_ONLY: return bool(A) == bool(B)
     X = NAND(A, B)
     Y = NAND(NAND(A, X), NAND(X, B))
     return NAND(Y, Y)
@@ -339,6 +348,7 @@ def NAND_NAND(A, B):
     >>> NAND_NAND(1, 1)
     0
     """
+    if not NAND_ONLY: return not (A and B)
     X = NAND(A, B)
     Y = NAND(X, X)
     return NAND(Y, Y)
@@ -379,6 +389,7 @@ def MUX(A, B, S):
     >>> MUX(1, 1, 1)
     1
     """
+    if not NAND_ONLY: return bool(B if S else A)
     return NAND(NAND(A, NAND(S, S)), NAND(S, B))
 
 
@@ -405,11 +416,30 @@ def DEMUX(A, S):
     >>> DEMUX(1, 1)
     (0, 1)
     """
+    if not NAND_ONLY: return bool(A and not S), bool(A and S)
     X = NAND(A, NAND(S, S))
     Y = NAND(A, S)
     return NAND(X, X), NAND(Y, Y)
 
 
+def doctest_nand_only() -> None:
+    """
+    >>> import sys
+    >>> module = sys.modules[doctest_nand_only.__module__]
+    >>> gates = NAND_AND, NAND_XOR, NAND_OR, NAND_NOR, NAND_XNOR, NAND_NAND
+    >>> def outputs(): return ([[gate(A, B) for A in (0, 1, 2) for B in (0, 1, 2)] for gate in gates],
+    ...                        [[MUX(A, B, S), DEMUX(A, S)] for A in (0, 1, 2) for B in (0, 1, 2) for S in (0, 1, 2)],
+    ...                        [[NAND_NOT(A), TNAND(A, A, 2)] for A in (0, 1, 2)])
+    >>> module.NAND_ONLY = True
+    >>> networks = outputs()
+    >>> module.NAND_ONLY = False
+    >>> outputs() == networks
+    True
+    >>> NAND_XOR(2, 1), NAND_OR(2, 1)
+    (0, 1)
+    """
+
+
 if __name__ == '__main__':
     import doctest
 
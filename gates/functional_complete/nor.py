@@ -32,6 +32,11 @@ def NOR(A, B):
     return not (A or B)
 
 
+# noinspection PyPep8Naming
+def _NOR_raw(A: int, B: int) -> int:  # uncast variant (0/1 int in/out) for bulk evaluation
+    return (A | B) ^ 1
+
+
 # TODO: https://en.wikipedia.org/wiki/NOR_logic
 
 
@@ -22,3 +22,15 @@ def NOT(a):
     NOT Gate
     """
     return not a
+
+
+# uncast variants (0/1 int in/out) for bulk evaluation
+
+# noinspection PyPep8Naming
+def _ID_raw(a: int) -> int:
+    return a
+
+
+# noinspection PyPep8Naming
+def _NOT_raw(a: int) -> int:
+    return a ^ 1
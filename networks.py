@@ -6,6 +6,18 @@ from typing import TypeVar
 _T = TypeVar('_T')
 
 
+def _pass(input_: _T) -> _T:
+    return input_
+
+
+# noinspection PyUnusedLocal
+def _block(input_: _T) -> None:
+    return None
+
+
+_TRI_STATES = (_block, _pass)  # indexed by control
+
+
 # noinspection PyPep8Naming
 def TRI_STATE(control):
     """
@@ -16,15 +28,7 @@ def TRI_STATE(control):
     >>> TRI_STATE(1)(1)
     1
     """
-    if control:
-        # noinspection PyPep8Naming
-        def tri_state(input_: _T) -> _T:
-            return input_
-    else:
-        # noinspection PyPep8Naming,PyUnusedLocal
-        def tri_state(input_: _T) -> None:
-            return None
-    return tri_state
+    return _TRI_STATES[bool(control)]
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 Logical Syntax Module
 """
 from collections.abc import Callable, Iterable
+from types import NotImplementedType
 
 __all__ = ['Proposition', 'F', 'T', 'TruthVar', 'TruthVarException']
 
@@ -10,45 +11,70 @@ class TruthVarException(Exception):
     pass
 
 
+def _reflected(other: object, name: str) -> NotImplementedType:
+    """ :returns: NotImplemented for operands with the reflected TruthVar operator (e.g. packed truth table columns) """
+    if hasattr(type(other), name): return NotImplemented
+    raise TypeError(f'unsupported operand: {other!r}')
+
+
 class TruthVar(int):
     def __new__(cls, value: int) -> 'TruthVar':
+        if cls is TruthVar: return T if value else F  # interned, see bottom of module
         return super().__new__(cls, bool(value))
 
     def __str__(self) -> str:
-        return 'T' if self.real else 'F'
+        return 'T' if self else 'F'
 
     def __and__(self, other: int) -> 'TruthVar':
-        return TruthVar(self.real and other.real)
+        try:
+            return TruthVar(self and other.real)
+        except AttributeError:
+            return _reflected(other, '__rand__')
 
     def __eq__(self, other: int | Iterable[int]) -> 'TruthVar':
         if isinstance(other, TruthVar):
             return TruthVar(self.real == other.real)
-        if isinstance(other, Iterable):
-            return TruthVar(all(map(self.real.__eq__, other)))
-        return NotImplemented
+        if isinstance(other, (list, tuple)):
+            return TruthVar(other.count(self) == len(other))  # interned self: identity hits
+        try:  # other iterables (e.g. generators)
+            values = iter(other)
+        except TypeError:
+            return NotImplemented
+        return TruthVar(all(map(self.real.__eq__, values)))
 
     def __rshift__(self, other: int) -> 'TruthVar':
-        return TruthVar(not self.real or other.real)
+        try:
+            return TruthVar(not self or other.real)
+        except AttributeError:
+            return _reflected(other, '__rrshift__')
 
     def __lshift__(self, other: int) -> 'TruthVar':
-        return TruthVar(self.real or not other.real)
+        try:
+            return TruthVar(self or not other.real)
+        except AttributeError:
+            return _reflected(other, '__rlshift__')
 
     def __invert__(self) -> 'TruthVar':
-        return TruthVar(not self.real)
+        return TruthVar(not self)
 
     def __or__(self, other: int) -> 'TruthVar':
-        return TruthVar(self.real or other.real)
+        try:
+            return TruthVar(self or other.real)
+        except AttributeError:
+            return _reflected(other, '__ror__')
 
     def __ne__(self, other: int | Iterable[int]) -> 'TruthVar':
         if isinstance(other, TruthVar):
             return TruthVar(self.real != other.real)
-        if isinstance(other, Iterable):
-            return TruthVar(all(map(self.real.__ne__, other)))
-        return NotImplemented
-
-    def __hash__(self) -> int:
-        return self.real
-
+        if isinstance(other, (list, tuple)):
+            return TruthVar(other.count(self) == 0)  # interned self: identity hits
+        try:  # other iterables (e.g. generators)
+            values = iter(other)
+        except TypeError:
+            return NotImplemented
+        return TruthVar(all(map(self.real.__ne__, values)))
+
+    __hash__ = int.__hash__
     __add__ = __or__
     __mul__ = __and__
     __neg__ = __invert__
@@ -56,5 +82,5 @@ class TruthVar(int):
 
 Proposition = Callable[..., bool | int | TruthVar]
 
-F = TruthVar(0)
-T = TruthVar(1)
+F = int.__new__(TruthVar, 0)
+T = int.__new__(TruthVar, 1)
@@ -1,16 +1,37 @@
 """
 Logical Truth Table Module
 """
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from functools import cache
 from itertools import product
+from types import CodeType
 from typing import Type, TypeVar
+from weakref import WeakKeyDictionary
 # LOCAL #
 from logical.syntax import *
 
-__all__ = ['is_contingency', 'is_contradiction', 'is_tautology', 'result', 'truth_values']
+__all__ = [
+    'is_contingency',
+    'is_contradiction',
+    'is_tautology',
+    'packed_eval',
+    'raw_result',
+    'result',
+    'result_packed',
+    'satisfying_count',
+    'tabulate',
+    'truth_values',
+    'truth_values_bitvec'
+]
 
 _T = TypeVar('_T')
 
+_ROWS_CACHE_MAX_N = 8  # row tuples of up to 2^8 rows are kept for reuse
+_BITVEC_CACHE: dict[tuple, int | None] = {}  # packed truth tables by proposition bytecode (oldest evicted)
+_BITVEC_CACHE_SIZE = 1024
+_TABULATE_MAX_N = 8  # truth tables of at most 2^8 bits are stored by @tabulate
+_TABULATED: WeakKeyDictionary = WeakKeyDictionary()  # packed truth tables by proposition (see tabulate)
+
 
 def truth_values(n: int, /, *, cast: Type[_T] = TruthVar) -> Iterator[tuple[_T, ...]]:
     """
@@ -29,12 +50,190 @@ def truth_values(n: int, /, *, cast: Type[_T] = TruthVar) -> Iterator[tuple[_T,
     return product([cast(0), cast(1)], repeat=n)
 
 
+@cache
+def _truth_rows(n: int, cast: Type[_T]) -> tuple[tuple[_T, ...], ...]:
+    return tuple(truth_values(n, cast=cast))
+
+
+@cache
+def truth_values_bitvec(n: int, /) -> tuple[int, ...]:
+    """
+    :returns: truth values of each variable packed into an integer (bit i = row i in binary order)
+
+    >>> [bin(column) for column in truth_values_bitvec(2)]
+    ['0b1100', '0b1010']
+    """
+    mask = (1 << (1 << n)) - 1
+    return tuple(mask ^ mask // ((1 << (1 << (n - k - 1))) + 1) for k in range(n))
+
+
+class _Column:
+    """
+    Truth Table Column Packed Into An Integer, With The Operators Of TruthVar
+    """
+    __slots__ = ('bits', 'mask')
+
+    def __init__(self, bits: int, mask: int) -> None:
+        self.bits = bits
+        self.mask = mask
+
+    def _other(self, other: '_Column | TruthVar') -> int:
+        if isinstance(other, _Column): return other.bits
+        if isinstance(other, TruthVar): return self.mask if other else 0  # constant column
+        raise TypeError(f'unsupported operand: {other!r}')
+
+    def __bool__(self) -> bool:
+        raise TypeError('truth value of a packed column is undefined')
+
+    def __and__(self, other: '_Column | TruthVar') -> '_Column':
+        return _Column(self.bits & self._other(other), self.mask)
+
+    def __or__(self, other: '_Column | TruthVar') -> '_Column':
+        return _Column(self.bits | self._other(other), self.mask)
+
+    def __invert__(self) -> '_Column':
+        return _Column(self.bits ^ self.mask, self.mask)
+
+    def __rshift__(self, other: '_Column | TruthVar') -> '_Column':
+        return _Column(self.bits ^ self.mask | self._other(other), self.mask)
+
+    def __lshift__(self, other: '_Column | TruthVar') -> '_Column':
+        return _Column(self.bits | self._other(other) ^ self.mask, self.mask)
+
+    def __rrshift__(self, other: TruthVar) -> '_Column':
+        return _Column(self._other(other) ^ self.mask | self.bits, self.mask)
+
+    def __rlshift__(self, other: TruthVar) -> '_Column':
+        return _Column(self._other(other) | self.bits ^ self.mask, self.mask)
+
+    def __eq__(self, other: '_Column | TruthVar') -> '_Column':
+        return _Column(self.bits ^ self._other(other) ^ self.mask, self.mask)
+
+    def __ne__(self, other: '_Column | TruthVar') -> '_Column':
+        return _Column(self.bits ^ self._other(other), self.mask)
+
+    __add__ = __radd__ = __ror__ = __or__
+    __mul__ = __rmul__ = __rand__ = __and__
+    __neg__ = __invert__
+    __hash__ = None
+
+
+def packed_eval(formula: Callable, n: int, column: type = _Column) -> int | None:
+    """
+    Evaluates a formula of n variables on all 2^n rows at once, each variable being a column(bits, mask)
+
+    :returns: the bits of the resulting column or None when the formula refuses packed columns
+
+    >>> bin(packed_eval(lambda p, q: p >> q, 2))
+    '0b1011'
+    >>> packed_eval(lambda p, q: p if q else ~p, 2) is None
+    True
+    """
+    mask = (1 << (1 << n)) - 1
+    try:
+        res = formula(*(column(bits, mask) for bits in truth_values_bitvec(n)))
+    except (AttributeError, TypeError):
+        return None
+    return res.bits if isinstance(res, column) else None
+
+
+def _bitvec_key(proposition: Proposition) -> tuple | None:
+    """
+    :returns: the bytecode and the TruthVar constants of the proposition, or None when it reads anything else
+
+    Attribute loads and calls can read mutable state, so only propositions whose names all resolve to TruthVar
+    globals (and whose keyword defaults are TruthVars) are keyed.
+    """
+    code = proposition.__code__
+    if code.co_freevars: return None  # closure values are not part of the key
+    if any(isinstance(const, CodeType) for const in code.co_consts): return None  # nested code reads more names
+    values = tuple(proposition.__globals__.get(name) for name in code.co_names)
+    kwdefaults = tuple(sorted((proposition.__kwdefaults__ or {}).items()))
+    if not all(isinstance(value, TruthVar) for value in values + tuple(v for _, v in kwdefaults)): return None
+    key = code.co_code, code.co_consts, code.co_names, code.co_argcount, values, kwdefaults
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _bitvec_eval(proposition: Proposition, n: int) -> int | None:
+    """
+    :returns: the truth table packed into an integer or None when the proposition refuses packed columns
+    """
+    if proposition in _TABULATED: return _TABULATED[proposition]
+    key = _bitvec_key(proposition)
+    if key in _BITVEC_CACHE: return _BITVEC_CACHE[key]
+    res = packed_eval(proposition, n)
+    if key is not None:
+        if len(_BITVEC_CACHE) >= _BITVEC_CACHE_SIZE: del _BITVEC_CACHE[next(iter(_BITVEC_CACHE))]
+        _BITVEC_CACHE[key] = res
+    return res
+
+
 def result(proposition: Proposition, cast: Type[_T] = TruthVar) -> list[TruthVar]:
     """
     :returns: truth table result in binary order (from all False to all True)
     """
     n = proposition.__code__.co_argcount
-    return [proposition(*vars_) for vars_ in truth_values(n, cast=cast)]
+    if cast is TruthVar:  # the packed columns follow TruthVar semantics
+        res = _bitvec_eval(proposition, n)
+        if res is not None:
+            return [(F, T)[bit] for bit in _unpack(res, n)]
+    return list(_row_results(proposition, cast))
+
+
+def _row_results(proposition: Proposition, cast: Type[_T] = TruthVar) -> Iterator[TruthVar]:
+    """
+    :returns: truth table result in binary order, evaluated row by row as it is consumed
+    """
+    n = proposition.__code__.co_argcount
+    rows = _truth_rows(n, cast) if n <= _ROWS_CACHE_MAX_N else truth_values(n, cast=cast)
+    return (proposition(*vars_) for vars_ in rows)
+
+
+def raw_result(proposition: Proposition) -> list[int]:
+    """
+    :returns: truth table result in binary order as plain 0/1 ints (1 where the row is true)
+
+    >>> raw_result(lambda p, q: p >> q)
+    [1, 1, 0, 1]
+    """
+    return _unpack(result_packed(proposition), proposition.__code__.co_argcount)
+
+
+def _unpack(packed: int, n: int) -> list[int]:
+    return [packed >> i & 1 for i in range(1 << n)]
+
+
+def result_packed(proposition: Proposition) -> int:
+    """
+    :returns: truth table result packed into an integer (bit i = row i in binary order)
+
+    >>> bin(result_packed(lambda p, q: p >> q))
+    '0b1011'
+    """
+    n = proposition.__code__.co_argcount
+    res = _bitvec_eval(proposition, n)
+    if res is not None: return res
+    return sum(1 << i for i, value in enumerate(result(proposition)) if value)
+
+
+def tabulate(proposition: Proposition) -> Proposition:
+    """
+    Decorator storing the packed truth table of a proposition (of at most 8 variables) on definition
+
+    >>> @tabulate
+    ... def majority(p, q, r): return (p & q) | (q & r) | (p & r)
+    >>> result(majority)
+    [0, 0, 0, 1, 0, 1, 1, 1]
+    """
+    n = proposition.__code__.co_argcount
+    if n <= _TABULATE_MAX_N:
+        res = _bitvec_eval(proposition, n)
+        if res is not None: _TABULATED[proposition] = res
+    return proposition
 
 
 def steps(proposition: Proposition) -> list[TruthVar]:
@@ -46,15 +245,38 @@ def steps(proposition: Proposition) -> list[TruthVar]:
 
 
 def is_tautology(proposition: Proposition) -> bool:
-    return bool(result(proposition) == T)
+    n = proposition.__code__.co_argcount
+    res = _bitvec_eval(proposition, n)
+    if res is not None: return res == (1 << (1 << n)) - 1
+    return all(value == T for value in _row_results(proposition))
 
 
 def is_contradiction(proposition: Proposition) -> bool:
-    return bool(result(proposition) == F)
+    res = _bitvec_eval(proposition, proposition.__code__.co_argcount)
+    if res is not None: return res == 0
+    return all(value == F for value in _row_results(proposition))
 
 
 def is_contingency(proposition: Proposition) -> bool:
-    return not (is_tautology(proposition) or is_contradiction(proposition))
+    n = proposition.__code__.co_argcount
+    res = _bitvec_eval(proposition, n)
+    if res is not None: return 0 < res.bit_count() < 1 << n
+    not_true = not_false = False  # single pass, stops once both kinds of rows were seen
+    for value in _row_results(proposition):
+        not_true = not_true or not value == T
+        not_false = not_false or not value == F
+        if not_true and not_false: return True
+    return False
+
+
+def satisfying_count(proposition: Proposition) -> int:
+    """
+    :returns: number of rows on which the proposition is true
+
+    >>> satisfying_count(lambda p, q, r: p | q | r)
+    7
+    """
+    return result_packed(proposition).bit_count()
 
 # TODO: https://www.gatevidyalay.com/tag/satisfiability-and-tautology/
 
@@ -148,6 +370,25 @@ def doctest_tautologies_and_consequences() -> None:
     """
 
 
+def doctest_cached_tables() -> None:
+    """
+    >>> result(lambda p, *, c=T: p & c)
+    [0, 1]
+    >>> result(lambda p, *, c=F: p & c)
+    [0, 0]
+    >>> result(lambda p: p & (lambda: T)())
+    [0, 1]
+    >>> result(lambda p: p & (lambda: F)())
+    [0, 0]
+    >>> class Config: c = T
+    >>> result(lambda p: p & Config.c)
+    [0, 1]
+    >>> Config.c = F
+    >>> result(lambda p: p & Config.c)
+    [0, 0]
+    """
+
+
 if __name__ == '__main__':
     import doctest
 